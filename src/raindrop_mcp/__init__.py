@@ -1,19 +1,28 @@
+import asyncio
+import contextlib
 from typing import Annotated, Optional
 
-from fastmcp import FastMCP
-from pydantic import Field
+from fastmcp import Client, FastMCP
+from pydantic import Field, TypeAdapter
+from pydantic_core import from_json, to_json
 
 from raindrop_mcp.model import (
+    BatchOperation,
     CollectionItem,
+    CollectionItemList,
+    GroupList,
     RaindropCreate,
+    RaindropList,
     RaindropsUpdate,
     RaindropUpdate,
+    TagList,
 )
 from raindrop_mcp.raindrop import (
+    client,
     create_collection,
     create_raindrop,
+    create_raindrops,
     delete_collections,
-    delete_raindrop,
     delete_raindrops,
     delete_tags,
     get_collection,
@@ -25,7 +34,6 @@ from raindrop_mcp.raindrop import (
     get_total_raindrops,
     get_user,
     merge_tags,
-    rename_tag,
     update_collection,
     update_raindrop,
     update_raindrops,
@@ -40,33 +48,90 @@ mcp = FastMCP(
     include_tags=['Raindrops', 'Bookmarks', 'Collections', 'Groups', 'User'],
 )
 
+# Ask Raindrop to fetch the page and fill in its title, excerpt and cover. The
+# request models are only dumped, never mutated, so one dict serves all calls.
+PLEASE_PARSE = {'weight': 1}
+
+# Argument types shared by several tools, so their schemas stay identical.
+CollectionIdArg = Annotated[
+    int,
+    Field(
+        description='ID of the collection (0 for all, -1 for unsorted, -99 for trash).'
+    ),
+]
+TagsArg = Annotated[
+    list[str] | None,
+    Field(description='List of tags for the raindrop.'),
+]
+ImportantArg = Annotated[
+    bool | None,
+    Field(description='Whether to mark the raindrop as important.'),
+]
+SearchFilterArg = Annotated[
+    str | None,
+    Field(description='Search term selecting the raindrops in the collection.'),
+]
+NestedArg = Annotated[
+    bool,
+    Field(description='Whether to include raindrops from nested collections.'),
+]
+
+
+def error_result(error: str) -> str:
+    # Tools that answer with JSON text report failures as JSON text too, so
+    # FastMCP passes both branches through without another encoding pass.
+    return to_json({'error': error}).decode()
+
+
+def dump_result(value, error: str, adapter: TypeAdapter | None = None):
+    """Serialize a tool's result, or return ``error`` when it is empty.
+
+    Models are dumped with their own serializer; lists need the matching
+    ``adapter`` from ``raindrop_mcp.model``.
+    """
+    if not value:
+        return error_result(error)
+
+    if adapter is None:
+        return value.model_dump_json(exclude_unset=True, exclude_none=True)
+
+    return adapter.dump_json(value, exclude_unset=True, exclude_none=True).decode()
+
+
+# Per-ID lookups run concurrently, but share one limit across every tool call
+# (batches included) so long ID lists do not burst through Raindrop's rate
+# limit.
+MAX_CONCURRENT_FETCHES = 5
+fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+
+async def fetch_all(fetch, ids: list[int]):
+    async def bounded(id: int):
+        async with fetch_semaphore:
+            return await fetch(id)
+
+    # gather keeps results in ID order; the tool answers with one text block,
+    # so finishing out of order would not get anything to the client sooner.
+    return await asyncio.gather(*map(bounded, ids))
+
 
 @mcp.tool(
     description="Get the current user's information from Raindrop.io",
     tags=['User'],
 )
-def raindrop_get_user():
-    user_info = get_user()
-    return (
-        user_info.model_dump_json(exclude_unset=True, exclude_none=True)
-        if user_info
-        else {'error': 'Failed to retrieve user information.'}
-    )
+async def raindrop_get_user():
+    user_info = await get_user()
+    return dump_result(user_info, 'Failed to retrieve user information.')
 
 
 @mcp.tool(
     description='Get the total number of raindrops for a specific collection',
     tags=['Collections'],
 )
-def raindrop_get_total_raindrops(
-    collection_id: Annotated[
-        int,
-        Field(
-            description='ID of the collection to get the total count for (0 for all, -1 for unsorted, -99 for trash).'
-        ),
-    ],
+async def raindrop_get_total_raindrops(
+    collection_id: CollectionIdArg,
 ):
-    total_raindrops = get_total_raindrops(collection_id)
+    total_raindrops = await get_total_raindrops(collection_id)
     return total_raindrops
 
 
@@ -74,78 +139,69 @@ def raindrop_get_total_raindrops(
     description='Get the list of groups associated with the current user, optionally filtered by name',
     tags=['Groups'],
 )
-def raindrop_get_groups(
+async def raindrop_get_groups(
     name: Annotated[
         Optional[str],
         Field(description='Name of the group to filter by.'),
     ] = None,
 ):
-    groups = get_groups()
+    groups = await get_groups()
     if not groups:
-        return {'error': 'No groups found.'}
+        return error_result('No groups found.')
 
     if name:
-        groups = [g for g in groups if g.title == name]
-        if not groups:
-            return {'error': f'Group "{name}" not found.'}
+        # Titles are unique, so stop at the first match.
+        group = next((g for g in groups if g.title == name), None)
+        if not group:
+            return error_result(f'Group "{name}" not found.')
+        groups = [group]
 
-    return [group.model_dump(exclude_unset=True, exclude_none=True) for group in groups]
+    return dump_result(groups, 'No groups found.', GroupList)
 
 
 @mcp.tool(
     description='Get all collections or specific collections by ID',
     tags=['Collections'],
 )
-def raindrop_get_collections(
+async def raindrop_get_collections(
     collection_ids: Annotated[
         Optional[list[int]],
         Field(description='List of collection IDs to retrieve. If not provided, returns all collections.'),
     ] = None,
 ):
     if collection_ids:
-        results = []
-        for cid in collection_ids:
-            collection = get_collection(cid)
-            if collection:
-                results.append(collection.model_dump(exclude_unset=True, exclude_none=True))
-        return results if results else {'error': 'No collections found for the provided IDs.'}
-    
-    collections = get_collections()
-    return (
-        [
-            collection.model_dump(exclude_unset=True, exclude_none=True)
-            for collection in collections
-        ]
-        if collections
-        else {'error': 'Failed to retrieve collections.'}
-    )
+        collections = await fetch_all(get_collection, collection_ids)
+        results = [collection for collection in collections if collection]
+        return dump_result(
+            results, 'No collections found for the provided IDs.', CollectionItemList
+        )
+
+    collections = await get_collections()
+    return dump_result(collections, 'Failed to retrieve collections.', GroupList)
 
 
 @mcp.tool(
     description='Create a new collection',
     tags=['Collections'],
 )
-def raindrop_create_collection(
+async def raindrop_create_collection(
     title: str,
     parent_id: Annotated[
-        int,
+        Optional[int],
         Field(
-            description='ID of the parent collection (0 for root, -1 for unsorted, -99 for trash).'
+            description='ID of the parent collection (0 or omitted for root, -1 for unsorted, -99 for trash).'
         ),
     ] = None,
 ):
-    collection = create_collection(
-        CollectionItem(title=title, parentId=parent_id if parent_id else None)
-    )
-    return (
-        collection.model_dump_json(exclude_unset=True, exclude_none=True)
-        if collection
-        else {'error': 'Failed to create collection.'}
+    # A root collection is one without a parent, so 0 is sent as no parentId.
+    collection = await create_collection(
+        CollectionItem.model_construct(title=title, parentId=parent_id or None)
     )
+    return dump_result(collection, 'Failed to create collection.')
 
 
 @mcp.tool(description='Update an existing collection (rename or move)', tags=['Collections'])
-def raindrop_update_collection(
+async def raindrop_update_collection(
     collection_id: Annotated[
         int,
         Field(description='ID of the collection to update.'),
@@ -159,17 +215,11 @@ def raindrop_update_collection(
         Field(description='New parent ID to move the collection to.'),
     ] = None,
 ):
-    update_data = CollectionItem()
-    if title is not None:
-        update_data.title = title
-    if parent_id is not None:
-        update_data.parentId = parent_id
-
-    collection = update_collection(collection_id, update_data)
-    return (
-        collection.model_dump_json(exclude_unset=True, exclude_none=True)
-        if collection
-        else {'error': f'Failed to update collection with ID "{collection_id}".'}
+    collection = await update_collection(
+        collection_id, CollectionItem.model_construct(title=title, parentId=parent_id)
+    )
+    return dump_result(
+        collection, f'Failed to update collection with ID "{collection_id}".'
     )
 
 
@@ -177,13 +227,13 @@ def raindrop_update_collection(
     description='Delete collections (single or bulk)',
     tags=['Collections'],
 )
-def raindrop_delete_collections(
+async def raindrop_delete_collections(
     collection_ids: Annotated[
         list[int],
         Field(description='List of collection IDs to delete.'),
     ],
 ):
-    success = delete_collections(collection_ids)
+    success = await delete_collections(collection_ids)
     return (
         {'message': 'Collections deleted successfully.'}
         if success
@@ -214,7 +264,7 @@ def raindrop_delete_collections(
     """,
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_get_raindrops(
+async def raindrop_get_raindrops(
     collection_id: Annotated[
         int,
         Field(
@@ -232,36 +282,26 @@ def raindrop_get_raindrops(
     perpage: Annotated[
         int | None, Field(description='Number of items per page.')
     ] = None,
-    nested: Annotated[
-        bool, Field(description='Whether to include nested items.')
-    ] = False,
+    nested: NestedArg = False,
 ):
     if raindrop_ids:
-        results = []
-        for rid in raindrop_ids:
-            raindrop = get_raindrop(rid)
-            if raindrop:
-                results.append(raindrop.model_dump(exclude_unset=True, exclude_none=True))
-        return results if results else {'error': 'No raindrops found for the provided IDs.'}
-
-    raindrops_response = get_raindrops(collection_id, search, page, perpage, nested)
-    if not raindrops_response:
-        return {'error': 'No raindrops found.'}
-
-    return {
-        'items': [
-            raindrop.model_dump(exclude_unset=True, exclude_none=True)
-            for raindrop in raindrops_response.items
-        ],
-        'count': raindrops_response.count,
-    }
+        raindrops = await fetch_all(get_raindrop, raindrop_ids)
+        results = [raindrop for raindrop in raindrops if raindrop]
+        return dump_result(
+            results, 'No raindrops found for the provided IDs.', RaindropList
+        )
+
+    raindrops_response = await get_raindrops(
+        collection_id, search, page, perpage, nested
+    )
+    return dump_result(raindrops_response, 'No raindrops found.')
 
 
 @mcp.tool(
     description='Create a new raindrop.',
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_create_raindrop(
+async def raindrop_create_raindrop(
     link: Annotated[
         str,
         Field(description='Link of the raindrop to create.'),
@@ -272,36 +312,69 @@ def raindrop_create_raindrop(
             description='ID of the collection to create the raindrop in (-1 for unsorted, -99 for trash).'
         ),
     ] = None,
-    tags: Annotated[
-        list[str] | None,
-        Field(description='List of tags for the raindrop.'),
-    ] = None,
-    important: Annotated[
-        bool | None,
-        Field(description='Whether to mark the raindrop as important.'),
-    ] = None,
+    tags: TagsArg = None,
+    important: ImportantArg = None,
 ):
-    raindrop = create_raindrop(
-        RaindropCreate(
+    raindrop = await create_raindrop(
+        RaindropCreate.model_construct(
             link=link,
             collectionId=collection_id,
             tags=tags,
             important=important,
-            pleaseParse={'weight': 1},
+            pleaseParse=PLEASE_PARSE,
         )
     )
-    return (
-        raindrop.model_dump_json(exclude_unset=True, exclude_none=True)
-        if raindrop
-        else {'error': 'Failed to create raindrop.'}
+    return dump_result(raindrop, 'Failed to create raindrop.')
+
+
+@mcp.tool(
+    description="""
+    Create up to 100 raindrops in a single request.
+
+    Prefer this over calling `raindrop_create_raindrop` once per link.
+    """,
+    tags=['Raindrops', 'Bookmarks'],
+)
+async def raindrop_create_raindrops(
+    links: Annotated[
+        list[str],
+        Field(description='Links of the raindrops to create.', max_length=100),
+    ],
+    collection_id: Annotated[
+        int | None,
+        Field(
+            description='ID of the collection to create the raindrops in (-1 for unsorted, -99 for trash).'
+        ),
+    ] = None,
+    tags: Annotated[
+        list[str] | None,
+        Field(description='List of tags for the raindrops.'),
+    ] = None,
+    important: Annotated[
+        bool | None,
+        Field(description='Whether to mark the raindrops as important.'),
+    ] = None,
+):
+    raindrops = await create_raindrops(
+        [
+            RaindropCreate.model_construct(
+                link=link,
+                collectionId=collection_id,
+                tags=tags,
+                important=important,
+                pleaseParse=PLEASE_PARSE,
+            )
+            for link in links
+        ]
     )
+    return dump_result(raindrops, 'Failed to create raindrops.', RaindropList)
 
 
 @mcp.tool(
     description='Update an existing raindrop (change properties or move)',
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_update_raindrop(
+async def raindrop_update_raindrop(
     raindrop_id: Annotated[
         int,
         Field(description='ID of the raindrop to update.'),
@@ -310,41 +383,38 @@ def raindrop_update_raindrop(
         str | None,
         Field(description='Link of the raindrop to update.'),
     ] = None,
-    tags: Annotated[
-        list[str] | None,
-        Field(description='List of tags for the raindrop.'),
-    ] = None,
-    important: Annotated[
-        bool | None,
-        Field(description='Whether to mark the raindrop as important.'),
-    ] = None,
+    tags: TagsArg = None,
+    important: ImportantArg = None,
     collection_id: Annotated[
         Optional[int],
         Field(description='ID of the collection to move the raindrop to.'),
     ] = None,
 ):
-    raindrop = update_raindrop(
+    raindrop = await update_raindrop(
         raindrop_id,
-        RaindropUpdate(
+        RaindropUpdate.model_construct(
             link=link,
             tags=tags,
             important=important,
             collectionId=collection_id,
-            pleaseParse={'weight': 1} if link else None,
+            pleaseParse=PLEASE_PARSE if link else None,
         ),
     )
-    return (
-        raindrop.model_dump_json(exclude_unset=True, exclude_none=True)
-        if raindrop
-        else {'error': f'Failed to update raindrop with ID "{raindrop_id}".'}
+    return dump_result(
+        raindrop, f'Failed to update raindrop with ID "{raindrop_id}".'
     )
 
 
 @mcp.tool(
-    description='Bulk update raindrops in a collection (change properties or move)',
+    description="""
+    Bulk update raindrops in a collection (change properties or move).
+    Returns the number of raindrops modified.
+
+    Prefer this over calling `raindrop_update_raindrop` once per raindrop.
+    """,
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_update_raindrops(
+async def raindrop_update_raindrops(
     collection_id: Annotated[
         int,
         Field(
@@ -367,17 +437,12 @@ def raindrop_update_raindrops(
         Optional[int],
         Field(description='ID of the target collection to move the raindrops to.'),
     ] = None,
-    search: Annotated[
-        str | None,
-        Field(description='Search term to filter raindrops to update.'),
-    ] = None,
-    nested: Annotated[
-        bool, Field(description='Whether to include nested items in the update.')
-    ] = False,
+    search: SearchFilterArg = None,
+    nested: NestedArg = False,
 ):
-    modified = update_raindrops(
+    modified = await update_raindrops(
         collection_id,
-        RaindropsUpdate(
+        RaindropsUpdate.model_construct(
             ids=raindrop_ids,
             tags=tags,
             important=important,
@@ -386,16 +451,17 @@ def raindrop_update_raindrops(
         nested,
         search,
     )
-    return {
-        'modified': modified if modified else {'error': 'Failed to update raindrops.'}
-    }
+    if modified is None:
+        return error_result('Failed to update raindrops.')
+
+    return modified
 
 
 @mcp.tool(
-    description='Delete raindrops (single or bulk)',
+    description='Delete raindrops (single or bulk). Returns the number of raindrops deleted.',
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_delete_raindrops(
+async def raindrop_delete_raindrops(
     raindrop_ids: Annotated[
         list[int],
         Field(description='List of raindrop IDs to delete.'),
@@ -403,61 +469,56 @@ def raindrop_delete_raindrops(
     collection_id: Annotated[
         Optional[int],
         Field(
-            description='ID of the collection containing the raindrops (0 for all but trash excluded). Required for bulk deletion optimization, but optional if deleting by ID one by one.'
+            description='ID of the collection containing the raindrops (0 for all but trash excluded). Defaults to all collections when deleting by ID.'
         ),
     ] = None,
     search: Annotated[
         str | None,
-        Field(description='Search term to filter raindrops to delete (requires collection_id).'),
+        Field(
+            description='Search term selecting the raindrops to delete (requires collection_id).'
+        ),
     ] = None,
     permanent: Annotated[
         bool,
         Field(description='Whether to permanently delete the raindrops.'),
     ] = False,
 ):
-    # If collection_id is provided, use the bulk endpoint
-    if collection_id is not None:
-        modified = delete_raindrops(collection_id, False, search, raindrop_ids, permanent)
-        return (
-            {'modified': modified} if modified else {'error': 'Failed to delete raindrops.'}
-        )
-    
-    # If no collection_id, delete one by one (less efficient but flexible)
-    if raindrop_ids:
-        count = 0
-        for rid in raindrop_ids:
-            if delete_raindrop(rid, permanent):
-                count += 1
-        return {'modified': count}
-    
-    return {'error': 'Either collection_id or raindrop_ids must be provided.'}
+    if collection_id is None:
+        if not raindrop_ids:
+            return error_result('Either collection_id or raindrop_ids must be provided.')
+
+        if search:
+            return error_result('search requires collection_id.')
+
+        # raindrops/0 accepts IDs from any collection, so deleting by ID alone is
+        # still a single bulk request.
+        collection_id = 0
+
+    modified = await delete_raindrops(
+        collection_id, False, search, raindrop_ids, permanent
+    )
+    if modified is None:
+        return error_result('Failed to delete raindrops.')
+
+    return modified
 
 
 @mcp.tool(
     description='Get tags for a collection',
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_get_tags(
-    collection_id: Annotated[
-        int,
-        Field(
-            description='ID of the collection to get tags for (0 for all, -1 for unsorted, -99 for trash).'
-        ),
-    ] = 0,
+async def raindrop_get_tags(
+    collection_id: CollectionIdArg = 0,
 ):
-    tags = get_tags(collection_id)
-    return (
-        [tag.model_dump(exclude_unset=True, exclude_none=True) for tag in tags]
-        if tags
-        else {'error': 'No tags found.'}
-    )
+    tags = await get_tags(collection_id)
+    return dump_result(tags, 'No tags found.', TagList)
 
 
 @mcp.tool(
     description='Update tags (rename or merge)',
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_update_tags(
+async def raindrop_update_tags(
     target_tag: Annotated[
         str,
         Field(description='The new tag name (target).'),
@@ -466,26 +527,12 @@ def raindrop_update_tags(
         list[str],
         Field(description='List of tags to be renamed or merged into the target tag.'),
     ],
-    collection_id: Annotated[
-        int,
-        Field(
-            description='ID of the collection to update tags in (0 for all, -1 for unsorted, -99 for trash).'
-        ),
-    ] = 0,
+    collection_id: CollectionIdArg = 0,
 ):
-    # If only one source tag, it's a rename
-    if len(source_tags) == 1:
-        success = rename_tag(source_tags[0], target_tag, collection_id)
-        return (
-            {'message': f'Tag "{source_tags[0]}" renamed to "{target_tag}" successfully.'}
-            if success
-            else {'error': f'Failed to rename tag "{source_tags[0]}".'}
-        )
-    
-    # If multiple source tags, it's a merge
-    success = merge_tags(target_tag, source_tags, collection_id)
+    # Renaming is merging a single source tag; the API handles both alike.
+    success = await merge_tags(target_tag, source_tags, collection_id)
     return (
-        {'message': 'Tags merged successfully.'}
+        {'message': f'Tags merged into "{target_tag}" successfully.'}
         if success
         else {'error': 'Failed to merge tags.'}
     )
@@ -495,19 +542,14 @@ def raindrop_update_tags(
     description='Delete a tag',
     tags=['Raindrops', 'Bookmarks'],
 )
-def raindrop_delete_tag(
+async def raindrop_delete_tag(
     tags: Annotated[
         list[str],
         Field(description='List of tags to delete.'),
     ],
-    collection_id: Annotated[
-        int,
-        Field(
-            description='ID of the collection to delete the tag from (0 for all, -1 for unsorted, -99 for trash).'
-        ),
-    ] = 0,
+    collection_id: CollectionIdArg = 0,
 ):
-    success = delete_tags(tags, collection_id)
+    success = await delete_tags(tags, collection_id)
     return (
         {'message': 'Tags deleted successfully.'}
         if success
@@ -515,5 +557,119 @@ def raindrop_delete_tag(
     )
 
 
+@mcp.resource(
+    'raindrop://groups',
+    description="The current user's groups and the collection IDs in each.",
+    mime_type='application/json',
+    tags={'Groups'},
+)
+async def raindrop_groups():
+    groups = await get_groups()
+    return dump_result(groups, 'No groups found.', GroupList)
+
+
+@mcp.resource(
+    'raindrop://tags/{collection_id}',
+    description='Tags used in a collection (0 for all, -1 for unsorted, -99 for trash).',
+    mime_type='application/json',
+    tags={'Raindrops', 'Bookmarks'},
+)
+async def raindrop_tags(collection_id: int):
+    tags = await get_tags(collection_id)
+    return dump_result(tags, 'No tags found.', TagList)
+
+
+@mcp.tool(
+    description="""
+    Run several of the other tools in one call, up to `max_concurrent` at a time.
+
+    Each operation names a tool and its arguments; results come back in the
+    same order as `{"tool": ..., "result": ...}` or `{"tool": ..., "error": ...}`.
+    Prefer this over calling tools one by one for independent operations.
+    """,
+    tags=['Raindrops', 'Bookmarks', 'Collections'],
+)
+async def raindrop_batch_execute(
+    operations: Annotated[
+        list[BatchOperation],
+        Field(description='Tool calls to run.', max_length=50),
+    ],
+    max_concurrent: Annotated[
+        int,
+        Field(description='Maximum number of operations running at once.', ge=1, le=16),
+    ] = 8,
+    stop_on_error: Annotated[
+        bool,
+        Field(description='Skip operations that have not started once one fails.'),
+    ] = False,
+):
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = False
+
+    async def execute(operation: BatchOperation):
+        nonlocal failed
+
+        async with semaphore:
+            if failed and stop_on_error:
+                return {'tool': operation.tool, 'error': 'Skipped after a failure.'}
+
+            try:
+                if operation.tool == 'raindrop_batch_execute':
+                    raise ValueError('Batches cannot be nested.')
+
+                result = await session.call_tool(
+                    operation.tool, operation.arguments, raise_on_error=False
+                )
+
+                # Every tool answers with a single JSON text block.
+                text = result.content[0].text if result.content else None
+                if result.is_error:
+                    raise ValueError(text or 'Tool call failed.')
+
+                output = from_json(text) if text is not None else None
+            except Exception as e:
+                failed = True
+                return {'tool': operation.tool, 'error': str(e)}
+
+        if isinstance(output, dict) and 'error' in output:
+            failed = True
+
+        return {'tool': operation.tool, 'result': output}
+
+    # An in-memory client goes through the same tools/call handling as a remote
+    # one, so tag filters, disabled tools and middleware all still apply.
+    async with Client(mcp) as session:
+        results = await asyncio.gather(*(execute(op) for op in operations))
+
+    return to_json(results).decode()
+
+
+async def prefetch():
+    # Agents list collections before creating anything, so fetch the tree (and
+    # the user it is grouped by) while the client is still connecting. Nothing
+    # is cached on failure, so the first tool call fetches again and reports
+    # the error itself.
+    with contextlib.suppress(Exception):
+        await get_collections()
+
+
+async def run():
+    # Share one connection pool for the server's lifetime and close it on exit.
+    async with client:
+        task = asyncio.create_task(prefetch())
+        try:
+            await mcp.run_async()
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
 def main():
-    mcp.run()
+    # uvloop is optional (and unavailable on Windows); use it when installed.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run())
+    else:
+        uvloop.run(run())
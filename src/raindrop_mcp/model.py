@@ -1,20 +1,19 @@
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
 
 
-class RaindropBaseModel(BaseModel):
-    result: bool
+def unwrap_ref(value):
+    # The API nests references to other objects as {"$id": ...}.
+    if isinstance(value, dict):
+        return value.get('$id')
 
-    @classmethod
-    @field_validator('result')
-    def check_result(cls, value):
-        if not value:
-            raise ValueError('Request failed')
+    return value
 
-        return value
 
+Ref = Annotated[Optional[int], BeforeValidator(unwrap_ref)]
 
-class User(RaindropBaseModel):
+
+class User(BaseModel):
     class Data(BaseModel):
         id: Optional[int] = Field(alias='_id', default=None)
         fullName: str
@@ -25,10 +24,6 @@ class User(RaindropBaseModel):
     user: Data
 
 
-class Parent(BaseModel):
-    id: Optional[int] = Field(alias='$id', default=None)
-
-
 class Group(BaseModel):
     title: str
     collections: list[int] = []
@@ -42,16 +37,16 @@ class CollectionItem(BaseModel):
     order: int = 0
     sort: int = 0
     public: bool = False
-    parent: Optional[Parent] = None
+    parent: Ref = None
     parentId: Optional[int] = None
     items: Optional[list['CollectionItem']] = None
 
 
-class Collection(RaindropBaseModel):
+class Collection(BaseModel):
     item: CollectionItem
 
 
-class CollectionItems(RaindropBaseModel):
+class CollectionItems(BaseModel):
     items: list[CollectionItem] = []
 
 
@@ -83,14 +78,14 @@ class RaindropsUpdate(BaseModel):
 
 class RaindropBaseResponse(RaindropBase):
     id: Optional[int] = Field(alias='_id', default=None)
-    collection: Optional[Parent] = None
+    collection: Ref = None
 
 
-class RaindropResponse(RaindropBaseModel):
+class RaindropResponse(BaseModel):
     item: RaindropBaseResponse
 
 
-class RaindropsResponse(RaindropBaseModel):
+class RaindropsResponse(BaseModel):
     items: list[RaindropBaseResponse] = []
     count: int = 0
 
@@ -104,5 +99,23 @@ class Tag(BaseModel):
     count: int = 0
 
 
-class Tags(RaindropBaseModel):
+class Tags(BaseModel):
     items: list[Tag] = []
+
+
+class BatchOperation(BaseModel):
+    tool: str
+    arguments: dict = {}
+
+
+# Resolve the forward references now so the first request does not pay for
+# building these validators.
+Group.model_rebuild()
+User.Data.model_rebuild()
+User.model_rebuild()
+
+# Serialize whole result lists in a single pydantic-core pass.
+GroupList = TypeAdapter(list[Group])
+CollectionItemList = TypeAdapter(list[CollectionItem])
+RaindropList = TypeAdapter(list[RaindropBaseResponse])
+TagList = TypeAdapter(list[Tag])
@@ -1,6 +1,11 @@
+import asyncio
+import functools
 import os
+import time
+from collections import OrderedDict
 
-import requests
+import httpx
+from pydantic_core import from_json
 
 from raindrop_mcp.model import (
     Collection,
@@ -21,30 +26,177 @@ from raindrop_mcp.model import (
 URL = 'https://api.raindrop.io/rest/v1'
 RAINDROP_ACCESS_TOKEN = os.getenv('RAINDROP_ACCESS_TOKEN')
 
-session = requests.Session()
-session.headers = {'Authorization': f'Bearer {RAINDROP_ACCESS_TOKEN}'}
+# Statuses worth retrying, per method. GET and PUT are idempotent, so any
+# transient failure is retried. DELETE is not: deleting a raindrop twice
+# removes it from the trash for good, so it is only retried on 429, where the
+# request was never processed. A retried POST could create a duplicate
+# raindrop or collection, so POST is never retried.
+TRANSIENT_STATUSES = frozenset([429, 500, 502, 503, 504])
+RETRY_STATUSES = {
+    'GET': TRANSIENT_STATUSES,
+    'PUT': TRANSIENT_STATUSES,
+    'DELETE': frozenset([429]),
+}
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.2
+# Longest server-requested wait a tool call will sit through before failing.
+MAX_RETRY_DELAY = 10.0
+
+# Every request goes to the same host, so keep a single pool. Over HTTP/2,
+# concurrent tool calls multiplex on one connection; the limits only matter
+# when the connection falls back to HTTP/1.1.
+client = httpx.AsyncClient(
+    base_url=URL,
+    headers={'Authorization': f'Bearer {RAINDROP_ACCESS_TOKEN}'},
+    # Fail fast on connect so a dead socket does not hold a pool slot, but
+    # leave room for large collection and search responses to arrive.
+    timeout=httpx.Timeout(15.0, connect=3.05),
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    ),
+)
+
 
+def ttl_cache(ttl: float, maxsize: int = 128):
+    """Memoize a function's results other than None for ``ttl`` seconds.
+
+    At most ``maxsize`` argument combinations are kept, evicting the least
+    recently used. Concurrent misses for the same arguments share a single
+    call instead of each hitting the API. The wrapped function gains
+    ``cache_clear()`` and ``cache_invalidate(*args, **kwargs)`` methods so
+    writes can drop stale entries. Cached values are shared, so callers must
+    not mutate them.
+    """
+
+    def decorator(func):
+        cache = OrderedDict()
+        pending = {}
+
+        async def load(key, args, kwargs):
+            value = await func(*args, **kwargs)
+            # A cache_clear() while the call was in flight means the value may
+            # predate a write, so hand it to the waiters without caching it.
+            if value is not None and pending.get(key) is asyncio.current_task():
+                cache[key] = (time.monotonic() + ttl, value)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return value
+
+        def forget(key, task):
+            if pending.get(key) is task:
+                del pending[key]
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+
+            entry = cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                cache.move_to_end(key)
+                return entry[1]
+
+            task = pending.get(key)
+            if task is None:
+                task = asyncio.ensure_future(load(key, args, kwargs))
+                pending[key] = task
+                task.add_done_callback(functools.partial(forget, key))
+
+            # Shield the shared call so one cancelled caller does not cancel it
+            # for everyone else waiting on it.
+            return await asyncio.shield(task)
+
+        def cache_clear():
+            cache.clear()
+            pending.clear()
+
+        def cache_invalidate(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            cache.pop(key, None)
+            pending.pop(key, None)
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_invalidate = cache_invalidate
+        return wrapper
+
+    return decorator
+
+
+# Last ETag and body per endpoint, for reads that revalidate instead of
+# downloading an unchanged response again once their TTL entry expires.
+etag_cache: dict[str, tuple[str, bytes]] = {}
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """Seconds to wait before retrying ``response``, or None to give up.
+
+    Honors a ``Retry-After`` header, or Raindrop's ``X-RateLimit-Reset`` epoch
+    on a 429, and falls back to exponential backoff.
+    """
+    delay = BACKOFF_FACTOR * 2**attempt
+    try:
+        if 'Retry-After' in response.headers:
+            delay = float(response.headers['Retry-After'])
+        elif response.status_code == 429 and 'X-RateLimit-Reset' in response.headers:
+            delay = float(response.headers['X-RateLimit-Reset']) - time.time()
+    except ValueError:
+        # An HTTP-date Retry-After; the backoff is a good enough guess.
+        pass
+
+    return max(delay, 0.0) if delay <= MAX_RETRY_DELAY else None
+
+
+async def make_request(
+    method, endpoint, conditional: bool = False, **kwargs
+) -> bytes | None:
+    cached = etag_cache.get(endpoint) if conditional else None
+    if cached:
+        kwargs['headers'] = {'If-None-Match': cached[0]}
+
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.request(method, endpoint, **kwargs)
+        if (
+            response.status_code not in RETRY_STATUSES.get(method, ())
+            or attempt == MAX_RETRIES
+        ):
+            break
+
+        delay = retry_delay(response, attempt)
+        if delay is None:
+            break
+
+        await asyncio.sleep(delay)
+
+    if cached and response.status_code == 304:
+        return cached[1]
 
-def make_request(method, endpoint, **kwargs) -> dict | None:
-    response = session.request(method, f'{URL}/{endpoint}', **kwargs)
     response.raise_for_status()
 
-    data = response.json()
-    return data
+    etag = response.headers.get('ETag')
+    if conditional and etag:
+        etag_cache[endpoint] = (etag, response.content)
+
+    # A 2xx status is the success signal; callers validate the raw body with
+    # ``model_validate_json`` so parsing happens inside pydantic-core.
+    return response.content or None
 
 
-def get_user() -> User | None:
-    data = make_request('GET', 'user')
-    return User(**data).user if data else None
+@ttl_cache(ttl=60)
+async def get_user() -> User | None:
+    data = await make_request('GET', 'user', conditional=True)
+    return User.model_validate_json(data).user if data else None
 
 
-def get_groups() -> list[Group] | None:
-    user = get_user()
+async def get_groups() -> list[Group] | None:
+    user = await get_user()
     return user.groups if user else None
 
 
-def get_group(name: str):
-    groups = get_groups()
+async def get_group(name: str):
+    groups = await get_groups()
     return (
         next((group for group in groups if group.title == name), None)
         if groups
@@ -52,57 +204,83 @@ def get_group(name: str):
     )
 
 
-def get_top_collections(
+def group_collections(
+    groups: list[Group], items: list[CollectionItem]
+) -> list[Group]:
+    """Sort collections into copies of the user's groups in a single pass.
+
+    Collections that no group lists go to the first group.
+    """
+    group_index = {
+        cid: index for index, group in enumerate(groups) for cid in group.collections
+    }
+    group_items: list[list[CollectionItem]] = [[] for _ in groups]
+    ungrouped_items: list[CollectionItem] = []
+    for item in items:
+        index = group_index.get(item.id)
+        if index is None:
+            ungrouped_items.append(item)
+        else:
+            group_items[index].append(item)
+
+    # FIXME: We need another request to user endpoint after creating collection
+    #       to make this item available in groups.
+    group_items[0].extend(ungrouped_items)
+
+    # Groups come from the cached user, so build copies instead of mutating.
+    return [
+        group.model_copy(update={'items': members, 'collections': None})
+        for group, members in zip(groups, group_items)
+    ]
+
+
+@ttl_cache(ttl=30)
+async def get_top_collections(
     flat: bool = False,
 ) -> list[Group] | list[CollectionItem] | None:
-    data = make_request('GET', 'collections')
+    if flat:
+        data = await make_request('GET', 'collections', conditional=True)
+        return CollectionItems.model_validate_json(data).items if data else None
+
+    data, groups = await asyncio.gather(
+        make_request('GET', 'collections', conditional=True), get_groups()
+    )
     if not data:
         return None
 
-    collections = CollectionItems(**data)
-    if flat:
-        return collections.items
-
-    groups = get_groups()
+    collections = CollectionItems.model_validate_json(data)
     if not groups:
         return None
 
-    for group in groups:
-        group.items = [c for c in collections.items if c.id in group.collections]
-        group.collections = None
+    return group_collections(groups, collections.items)
 
-    # FIXME: We need another request to user endpoint after creating collection
-    #       to make this item available in groups.
-    if groups:
-        ungrouped_items = [
-            c for c in collections.items if all(c.id not in g.items for g in groups)
-        ]
-        groups[0].items.extend(ungrouped_items)
 
-    return groups
-
-
-def get_collections() -> list[Group] | None:
-    data = make_request('GET', 'collections/all')
+@ttl_cache(ttl=30)
+async def get_collections_map() -> dict[int, CollectionItem] | None:
+    data = await make_request('GET', 'collections/all', conditional=True)
     if not data:
         return None
 
-    collections = CollectionItems(**data)
-    if not collections.items:
+    collections = CollectionItems.model_validate_json(data)
+    return {item.id: item for item in collections.items} or None
+
+
+@ttl_cache(ttl=30)
+async def get_collections() -> list[Group] | None:
+    collections_map, groups = await asyncio.gather(
+        get_collections_map(), get_groups()
+    )
+    if not collections_map:
         return None
 
-    collections_map = {item.id: item for item in collections.items}
+    # The map is cached too, so nest shallow copies instead of its items.
+    nodes = {id: item.model_copy() for id, item in collections_map.items()}
 
     root_items: list[CollectionItem] = []
-    for item in collections_map.values():
-        parent = item.parent
-        if not parent:
-            root_items.append(item)
-            continue
-
-        parent_id = parent.id
-        if parent_id and parent_id in collections_map:
-            parent = collections_map[parent_id]
+    for item in nodes.values():
+        parent_id = item.parent
+        if parent_id and parent_id in nodes:
+            parent = nodes[parent_id]
             if not parent.items:
                 parent.items = []
 
@@ -111,90 +289,122 @@ def get_collections() -> list[Group] | None:
 
         root_items.append(item)
 
-    groups = get_groups()
     if not groups:
         return None
 
-    for group in groups:
-        group.items = [c for c in root_items if c.id in group.collections]
-        group.collections = None
+    return group_collections(groups, root_items)
 
-    # FIXME: We need another request to user endpoint after creating collection
-    #       to make this item available in groups.
-    if groups:
-        ungrouped_items = [
-            c for c in root_items if all(c.id not in g.items for g in groups)
-        ]
-        groups[0].items.extend(ungrouped_items)
 
-    return groups
+@ttl_cache(ttl=30)
+async def get_collection(id: int) -> CollectionItem | None:
+    data = await make_request('GET', f'collection/{id}')
+    return Collection.model_validate_json(data).item if data else None
 
 
-def get_collection(id: int) -> CollectionItem | None:
-    data = make_request('GET', f'collection/{id}')
-    return Collection(**data).item if data else None
+@ttl_cache(ttl=30)
+async def get_user_stats() -> dict[int, int] | None:
+    data = await make_request('GET', 'user/stats')
+    if not data:
+        return None
 
+    stats = from_json(data)
+    return {item.get('_id'): item.get('count', 0) for item in stats.get('items', [])}
 
-def get_total_raindrops(
+
+async def get_total_raindrops(
     collection_id: int = 0,
 ) -> dict | None:
-    stats = make_request('GET', 'user/stats')
-    if not stats:
-        return None
-
     if collection_id not in [0, -1, -99]:
-        collection = get_collection(collection_id)
+        collections = await get_collections_map()
+        collection = collections.get(collection_id) if collections else None
         return {
             'count': collection.count if collection else 0,
         }
 
-    return {
-        'count': next(
-            (
-                item.get('count', 0)
-                for item in stats.get('items', [])
-                if item.get('_id') == collection_id
-            ),
-            0,
-        )
-    }
+    counts = await get_user_stats()
+    if counts is None:
+        return None
 
+    return {'count': counts.get(collection_id, 0)}
 
-def create_collection(collection: CollectionItem) -> CollectionItem | None:
-    data = make_request(
+
+def clear_count_caches():
+    # Raindrop writes change the per-collection and per-tag counts.
+    get_user_stats.cache_clear()
+    get_tags.cache_clear()
+    get_collection.cache_clear()
+    get_collections_map.cache_clear()
+    get_collections.cache_clear()
+    get_top_collections.cache_clear()
+
+
+def clear_collection_caches():
+    # Collection writes can also change group membership on the user, and
+    # deleting a collection moves its raindrops to the trash.
+    get_user.cache_clear()
+    get_raindrop.cache_clear()
+    clear_count_caches()
+
+
+def clear_raindrop_caches(ids: list[int] | None = None):
+    # Writes selected by search can touch any raindrop, so drop them all.
+    if ids is None:
+        get_raindrop.cache_clear()
+    else:
+        for id in ids:
+            get_raindrop.cache_invalidate(id)
+
+    clear_count_caches()
+
+
+def clear_tag_caches():
+    # Renaming, merging or deleting a tag rewrites it on every raindrop.
+    get_tags.cache_clear()
+    get_raindrop.cache_clear()
+
+
+async def create_collection(collection: CollectionItem) -> CollectionItem | None:
+    data = await make_request(
         'POST',
         'collection',
         json=collection.model_dump(exclude_unset=True, exclude_none=True),
     )
-    return Collection(**data).item if data else None
+    clear_collection_caches()
+    return Collection.model_validate_json(data).item if data else None
 
 
-def update_collection(id: int, collection: CollectionItem) -> CollectionItem | None:
-    data = make_request(
+async def update_collection(
+    id: int, collection: CollectionItem
+) -> CollectionItem | None:
+    data = await make_request(
         'PUT',
         f'collection/{id}',
         json=collection.model_dump(exclude_unset=True, exclude_none=True),
     )
-    return Collection(**data).item if data else None
+    clear_collection_caches()
+    return Collection.model_validate_json(data).item if data else None
 
 
-def delete_collection(id: int):
-    data = make_request('DELETE', f'collection/{id}')
+async def delete_collection(id: int):
+    data = await make_request('DELETE', f'collection/{id}')
+    clear_collection_caches()
     return True if data else False
 
 
-def delete_collections(ids: list):
+async def delete_collections(ids: list):
     payload = {'ids': ids}
-    data = make_request('DELETE', 'collections', json=payload)
+    data = await make_request('DELETE', 'collections', json=payload)
+    clear_collection_caches()
     return True if data else False
 
 
-def get_raindrop(raindrop_id: int):
-    data = make_request('GET', f'raindrop/{raindrop_id}')
-    return RaindropResponse(**data).item if data else None
+@ttl_cache(ttl=15, maxsize=256)
+async def get_raindrop(raindrop_id: int):
+    data = await make_request('GET', f'raindrop/{raindrop_id}')
+    return RaindropResponse.model_validate_json(data).item if data else None
 
 
-def get_raindrops(
+async def get_raindrops(
     collection_id: int = 0,
     search: str | None = None,
     page: int | None = None,
@@ -209,73 +419,67 @@ def get_raindrops(
     if perpage is not None:
         params['perpage'] = perpage
 
-    data = make_request('GET', f'raindrops/{collection_id}', params=params)
-    return RaindropsResponse(**data) if data else None
+    data = await make_request('GET', f'raindrops/{collection_id}', params=params)
+    return RaindropsResponse.model_validate_json(data) if data else None
 
 
-def create_raindrop(raindrop: RaindropCreate):
-    data = make_request(
+async def create_raindrop(raindrop: RaindropCreate):
+    data = await make_request(
         'POST',
         'raindrop',
         json=raindrop.model_dump(exclude_unset=True, exclude_none=True),
     )
-    return RaindropResponse(**data).item if data else None
+    clear_count_caches()
+    return RaindropResponse.model_validate_json(data).item if data else None
 
 
-# def create_raindrops(raindrop: list[RaindropItem]) -> list[RaindropItem] | None:
-#     data = make_request(
-#         'POST',
-#         'raindrops',
-#         json={
-#             'items': [
-#                 item.model_dump(exclude_unset=True, exclude_none=True)
-#                 for item in raindrop
-#             ]
-#         },
-#     )
-#     return [Raindrop(**item) for item in data] if data else None
+async def create_raindrops(raindrops: list[RaindropCreate]):
+    data = await make_request(
+        'POST',
+        'raindrops',
+        json={
+            'items': [
+                item.model_dump(exclude_unset=True, exclude_none=True)
+                for item in raindrops
+            ]
+        },
+    )
+    clear_count_caches()
+    return RaindropsResponse.model_validate_json(data).items if data else None
 
 
-def update_raindrop(raindrop_id: int, raindrop: RaindropUpdate):
-    data = make_request(
+async def update_raindrop(raindrop_id: int, raindrop: RaindropUpdate):
+    data = await make_request(
         'PUT',
         f'raindrop/{raindrop_id}',
         json=raindrop.model_dump(exclude_unset=True, exclude_none=True),
     )
-    return RaindropResponse(**data).item if data else None
+    clear_raindrop_caches([raindrop_id])
+    return RaindropResponse.model_validate_json(data).item if data else None
 
 
-def update_raindrops(
+async def update_raindrops(
     collection_id: int,
     raindrop: RaindropsUpdate,
     nested: bool = False,
     search: str | None = None,
 ):
     params = {'search': search, 'nested': nested} if search else {}
-    data = make_request(
+    data = await make_request(
         'PUT',
         f'raindrops/{collection_id}',
         params=params,
         json=raindrop.model_dump(exclude_unset=True, exclude_none=True),
     )
-    return UpdateDeleteRaindropsResponse(**data).modified if data else None
-
-
-def delete_raindrop(
-    raindrop_id: int,
-    permanent: bool = False,
-):
-    data = make_request('DELETE', f'raindrop/{raindrop_id}')
-    if permanent:
-        if not data:
-            raise ValueError('Failed to delete raindrop, no data returned.')
-
-        data = make_request('DELETE', f'raindrop/{raindrop_id}')
-
-    return True if data else False
+    clear_raindrop_caches(raindrop.ids if raindrop.ids and not search else None)
+    return (
+        UpdateDeleteRaindropsResponse.model_validate_json(data).modified
+        if data
+        else None
+    )
 
 
-def delete_raindrops(
+async def delete_raindrops(
     collection_id: int,
     nested: bool = False,
     search: str | None = None,
@@ -285,53 +489,54 @@ def delete_raindrops(
     params = {'search': search, 'nested': nested} if search else {}
     payload = {'ids': raindrop_ids} if raindrop_ids else {}
 
-    data = make_request(
+    data = await make_request(
         'DELETE', f'raindrops/{collection_id}', params=params, json=payload
     )
     if permanent:
         if not data:
             raise ValueError('Failed to delete raindrops, no data returned.')
 
-        data = make_request('DELETE', 'raindrops/-99', params=params, json=payload)
+        data = await make_request(
+            'DELETE', 'raindrops/-99', params=params, json=payload
+        )
 
-    return UpdateDeleteRaindropsResponse(**data).modified if data else None
+    clear_raindrop_caches(raindrop_ids if raindrop_ids and not search else None)
+    return (
+        UpdateDeleteRaindropsResponse.model_validate_json(data).modified
+        if data
+        else None
+    )
 
 
-def get_tags(
-    collection_id: int = 0,
-) -> list[Tag] | None:
-    endpoint = 'tags' if collection_id == 0 else f'tags/{collection_id}'
-    data = make_request('GET', endpoint)
-    return Tags(**data).items if data else None
+def tags_endpoint(collection_id: int) -> str:
+    # Collection 0 (all raindrops) is the bare tags endpoint.
+    return f'tags/{collection_id}' if collection_id else 'tags'
 
 
-def rename_tag(
-    replace: str,
-    tags: str,
+@ttl_cache(ttl=30)
+async def get_tags(
     collection_id: int = 0,
-) -> bool:
-    endpoint = 'tags' if collection_id == 0 else f'tags/{collection_id}'
-    payload = {'replace': replace, 'tags': [tags]}
-    data = make_request('PUT', endpoint, json=payload)
-    return True if data else False
+) -> list[Tag] | None:
+    data = await make_request('GET', tags_endpoint(collection_id))
+    return Tags.model_validate_json(data).items if data else None
 
 
-def merge_tags(
+async def merge_tags(
     replace: str,
     tags: list[str],
     collection_id: int = 0,
 ) -> bool:
-    endpoint = 'tags' if collection_id == 0 else f'tags/{collection_id}'
     payload = {'tags': tags, 'replace': replace}
-    data = make_request('PUT', endpoint, json=payload)
+    data = await make_request('PUT', tags_endpoint(collection_id), json=payload)
+    clear_tag_caches()
     return True if data else False
 
 
-def delete_tags(
+async def delete_tags(
     tags: list[str],
     collection_id: int = 0,
 ) -> bool:
-    endpoint = 'tags' if collection_id == 0 else f'tags/{collection_id}'
     payload = {'tags': tags}
-    data = make_request('DELETE', endpoint, json=payload)
+    data = await make_request('DELETE', tags_endpoint(collection_id), json=payload)
+    clear_tag_caches()
     return True if data else False